@@ -0,0 +1,178 @@
+#!/usr/bin/python3
+
+########################################################################
+# Copyright (c) 2023 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License 2.0 which is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+########################################################################
+
+import socket
+import struct
+import unittest.mock as mock
+
+import pytest  # type: ignore
+
+from dbcfeederlib import canclient_window_interface as cc
+
+
+def test_pack_unpack_classic():
+    buf = bytearray(cc.CANFD_MTU)
+    frame = cc._pack_frame(buf, 0x123 | cc.CAN_EFF_FLAG, b"\x01\x02\x03", False)
+    assert len(frame) == cc.CAN_MTU
+    assert bytes(frame[8:16]) == b"\x01\x02\x03" + bytes(5)
+
+    msg = cc._unpack_frame(frame, 0, len(frame), 1.0)
+    assert msg.arbitration_id == 0x123
+    assert msg.is_extended_id
+    assert not msg.is_remote_frame
+    assert not msg.is_fd
+    assert msg.data == b"\x01\x02\x03"
+    assert msg.timestamp == 1.0
+
+
+def test_pack_unpack_fd_pads_length():
+    buf = bytearray(cc.CANFD_MTU)
+    frame = cc._pack_frame(buf, 0x10, bytes(range(10)), True)
+    assert len(frame) == cc.CANFD_MTU
+    _, length, flags = cc._CAN_FRAME_HEADER.unpack_from(frame, 0)
+    assert length == 12
+    assert flags == cc.CANFD_FDF
+
+    msg = cc._unpack_frame(frame, 0, len(frame), 0.0)
+    assert msg.is_fd
+    assert msg.data == bytes(range(10)) + bytes(2)
+
+
+@pytest.mark.parametrize("length, is_fd", [(9, False), (65, True)])
+def test_pack_rejects_oversized_payload(length, is_fd):
+    buf = bytearray(cc.CANFD_MTU)
+    with pytest.raises(ValueError):
+        cc._pack_frame(buf, 0x10, bytes(length), is_fd)
+    assert len(buf) == cc.CANFD_MTU
+
+
+@pytest.mark.skipif(cc._recvmmsg is None, reason="recvmmsg() not available")
+def test_recv_batch():
+    rx, tx = socket.socketpair(socket.AF_UNIX, socket.SOCK_DGRAM)
+    try:
+        batch = cc._RecvBatch(4, cc.CAN_MTU)
+        assert batch.recv(rx.fileno(), 4) == 0
+
+        buf = bytearray(cc.CANFD_MTU)
+        for i in range(3):
+            tx.send(cc._pack_frame(buf, 0x100 + i, bytes([i]), False))
+        n = batch.recv(rx.fileno(), 4)
+        assert n == 3
+        msgs = batch.parse(n)
+        assert [msg.arbitration_id for msg in msgs] == [0x100, 0x101, 0x102]
+        assert [msg.data for msg in msgs] == [b"\x00", b"\x01", b"\x02"]
+    finally:
+        rx.close()
+        tx.close()
+
+
+def test_raw_client_set_filters():
+    client = cc.SocketCanRawClient.__new__(cc.SocketCanRawClient)
+    client._sock = mock.Mock()
+
+    client.set_filters([{"can_id": 0x123, "can_mask": 0x7FF},
+                        {"can_id": 0x456, "can_mask": 0x7FF, "extended": True}])
+    level, option, data = client._sock.setsockopt.call_args[0]
+    assert (level, option) == (socket.SOL_CAN_RAW, socket.CAN_RAW_FILTER)
+    assert struct.unpack("=4I", data) == (0x123, 0x7FF,
+                                          0x456 | cc.CAN_EFF_FLAG, 0x7FF | cc.CAN_EFF_FLAG)
+
+    client.set_filters(None)
+    assert struct.unpack("=2I", client._sock.setsockopt.call_args[0][2]) == (0, 0)
+
+
+def test_message_pool():
+    client = cc.CANClient(interface="virtual", channel="test_message_pool", notifier=False)
+    try:
+        assert len(client._free) == cc.MSG_POOL_SIZE
+        msg = client._wrap(mock.sentinel.frame)
+        assert msg.msg is mock.sentinel.frame
+        assert len(client._free) == cc.MSG_POOL_SIZE - 1
+
+        msg.release()
+        msg.release()
+        assert msg.msg is None
+        assert len(client._free) == cc.MSG_POOL_SIZE
+        assert list(client._free).count(msg) == 1
+    finally:
+        client.stop()
+
+
+@pytest.mark.skipif(cc._recvmmsg is None, reason="recvmmsg() not available")
+def test_recv_many_batch_returns_can_messages():
+    import can  # type: ignore
+    rx, tx = socket.socketpair(socket.AF_UNIX, socket.SOCK_DGRAM)
+    client = cc.CANClient(interface="virtual", channel="test_recv_many", notifier=False)
+    try:
+        # stand in for the socketcan socket the batch path reads
+        client._raw_fd = rx.fileno()
+        buf = bytearray(cc.CANFD_MTU)
+        tx.send(cc._pack_frame(buf, 0x123 | cc.CAN_EFF_FLAG, b"\x01\x02", False))
+        msgs = client.recv_many(4, timeout=1)
+        assert len(msgs) == 1
+        assert isinstance(msgs[0].msg, can.Message)
+        assert msgs[0].get_arbitration_id() == 0x123
+        assert msgs[0].is_extended_id()
+        assert bytes(msgs[0].get_data()) == b"\x01\x02"
+        msgs[0].release()
+    finally:
+        client.stop()
+        rx.close()
+        tx.close()
+
+
+def test_raw_client_recv_poll():
+    rx, tx = socket.socketpair(socket.AF_UNIX, socket.SOCK_DGRAM)
+    client = cc.SocketCanRawClient.__new__(cc.SocketCanRawClient)
+    client._init_state("socketcan", "test_raw_client_recv_poll", None, False, None)
+    client._sock = rx
+    client._rx_buf = bytearray(cc.CAN_MTU)
+    client._recv = rx.recv_into
+    client._can_errors = (OSError,)
+    client._timeout = rx.gettimeout()
+    try:
+        with mock.patch.object(cc.log, "error") as log_error:
+            assert client.recv(0) is None
+            assert client.recv(0) is None
+            log_error.assert_not_called()
+
+        tx.send(cc._pack_frame(bytearray(cc.CANFD_MTU), 0x42, b"\x07", False))
+        msg = client.recv(0)
+        assert msg.get_arbitration_id() == 0x42
+        msg.release()
+    finally:
+        rx.close()
+        tx.close()
+
+
+@pytest.mark.skipif(cc.np is None, reason="numpy not available")
+def test_recv_array_from_notifier():
+    import can  # type: ignore
+    client = cc.CANClient(interface="virtual", channel="test_recv_array", fd=True)
+    bus = can.interface.Bus(interface="virtual", channel="test_recv_array")
+    try:
+        bus.send(can.Message(arbitration_id=0x123, is_extended_id=True, is_remote_frame=True))
+        bus.send(can.Message(arbitration_id=0x12, is_extended_id=False, is_fd=True, data=bytes(range(1, 13))))
+        arr = client.recv_array(2, timeout=1)
+        if len(arr) < 2:
+            # the notifier may not have queued the second frame yet
+            arr = cc.np.concatenate([arr, client.recv_array(1, timeout=1)])
+        assert list(arr["id"]) == [0x123 | cc.CAN_EFF_FLAG | cc.CAN_RTR_FLAG, 0x12]
+        assert list(arr["flags"]) == [0, cc.CANFD_FDF]
+        assert list(arr["dlc"]) == [0, 12]
+        assert bytes(arr["data"][1]) == bytes(range(1, 13)) + bytes(52)
+    finally:
+        bus.shutdown()
+        client.stop()
@@ -11,65 +11,47 @@
 # SPDX-License-Identifier: Apache-2.0
 ########################################################################
 
-import logging
-from typing import Optional
-import can  # type: ignore
-from dbcfeederlib import canmessage
+"""
+SocketCAN client. The implementation is shared with the other interfaces in
+dbcfeederlib.canclient_window_interface, this module only keeps the import path.
+"""
 
-log = logging.getLogger(__name__)
+from dbcfeederlib import canclient_window_interface
+from dbcfeederlib.canclient_window_interface import CanPayload, SocketCanRawClient  # noqa: F401
 
 
-class CANClient:
+class CANClient(canclient_window_interface.CANClient):
     """
-    Wrapper class to hide dependency to CAN package.
-    Reason is to make it simple to replace the CAN package dependency with something else if your KUKSA.val
-    integration cannot interact directly with CAN, but rather interacts with some custom CAN solution/middleware.
+    Keeps the can.interface.Bus(*args, **kwargs) style constructor of the former SocketCAN client:
+    positional arguments are channel and interface, bustype is accepted for interface.
+    Unless requested, no notifier thread is started and the kernel receive buffer is left as is.
+    send() keeps the can.Message default of 29 bit identifiers.
     """
 
     def __init__(self, *args, **kwargs):
-        # pylint: disable=abstract-class-instantiated
-        self._bus = can.interface.Bus(*args, **kwargs)
+        if len(args) > 2:
+            raise TypeError("CANClient takes at most channel and interface as positional arguments")
+        for name, value in zip(("channel", "interface"), args):
+            kwargs[name] = value
+        if "bustype" in kwargs:
+            kwargs.setdefault("interface", kwargs.pop("bustype"))
+        kwargs.setdefault("notifier", False)
+        kwargs.setdefault("rcvbuf", None)
+        super().__init__(**kwargs)
 
-    def stop(self):
-        """Shut down CAN bus."""
-        self._bus.shutdown()
-
-    def recv(self, timeout: int = 1) -> Optional[canmessage.CANMessage]:
-        """Receive message from CAN bus."""
-        try:
-            msg = self._bus.recv(timeout)
-        except can.CanError:
-            msg = None
-            if self._bus:
-                log.error("Error while waiting for recv from CAN", exc_info=True)
-            else:
-                # This is expected if we are shutting down
-                log.debug("Exception received during shutdown")
-
-        if msg:
-            canmsg = canmessage.CANMessage(msg)
-            return canmsg
-        return None
-
-    def send(self, arbitration_id, data):
-        """Write message to CAN bus."""
-        msg = can.Message(arbitration_id=arbitration_id, data=data)
-        try:
-            self._bus.send(msg)
-            if log.isEnabledFor(logging.DEBUG):
-                log.debug("Sent message [channel: %s]: %s", self._bus.channel_info, msg)
-        except can.CanError:
-            log.error("Failed to send message via CAN bus")
+    def send(self, arbitration_id: int, data: CanPayload, is_extended_id: bool = True, is_fd: bool = None):
+        super().send(arbitration_id, data, is_extended_id, is_fd)
 
 
 '''
 Step to use:
 1. Init
-can_client = CANClient(vcan0)
+can_client = CANClient("vcan0")
 2. Receive -> return canmessage.CANMessage or None
 can_client.recv(timeout=<value>)
+   call release() on the returned message once it has been processed
 3. Send
 can_client.send(arbitration_id=<arb_id>, data=<data_val>)
 4. Stop
 can_client.stop
-'''
\ No newline at end of file
+'''
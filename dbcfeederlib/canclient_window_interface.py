@@ -1,36 +1,281 @@
+import collections
+import ctypes
+import errno
+import functools
 import logging
-from typing import Optional
-import can
+import os
 import platform
+import select
+import socket
+import struct
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Deque, List, Optional, Union
+from dbcfeederlib.canmessage import CANMessage
+
+# python-can is imported when a CANClient is created, loading it and its
+# interface registry is not needed by SocketCanRawClient or plain imports
+if TYPE_CHECKING:
+    import can  # type: ignore
+    from can.typechecking import CanFilters  # type: ignore
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:
+    np = None
 
 log = logging.getLogger(__name__)
 
-class CANMessage:
-    def __init__(self, msg: can.Message):
-        self.msg = msg
+_SYSTEM = platform.system().lower()
+_IS_WINDOWS = _SYSTEM == "windows"
+
+# Number of CANMessage wrappers preallocated per client
+MSG_POOL_SIZE = 256
+
+# Default number of frames fetched by a single recvmmsg() call
+RECV_BATCH_SIZE = 64
+
+# sizes of struct can_frame / struct canfd_frame, see <linux/can.h>
+CAN_MTU = 16
+CANFD_MTU = 72
+CAN_EFF_FLAG = 0x80000000
+CAN_RTR_FLAG = 0x40000000
+CAN_ERR_FLAG = 0x20000000
+CAN_EFF_MASK = 0x1FFFFFFF
+CANFD_FDF = 0x04
+MSG_DONTWAIT = 0x40
+# not exported by the socket module, see <asm-generic/socket.h>
+SO_RCVBUFFORCE = 33
+
+# Requested kernel receive buffer of SocketCAN sockets
+RCVBUF_SIZE = 8 * 1024 * 1024
+
+# can_id, len, flags
+_CAN_FRAME_HEADER = struct.Struct("<IBB2x")
+# valid CAN FD payload lengths
+_CANFD_LENGTHS = (0, 1, 2, 3, 4, 5, 6, 7, 8, 12, 16, 20, 24, 32, 48, 64)
+_ZERO_PAYLOAD = bytes(64)
+
+# Payloads are copied through the buffer protocol, passing a reused bytearray
+# or a memoryview of the encoder output avoids creating an intermediate bytes object
+CanPayload = Union[bytes, bytearray, memoryview]
+
+
+class _RawFrame:
+    """Minimal stand-in for can.Message holding a frame read from a raw SocketCAN socket"""
+
+    __slots__ = ("arbitration_id", "is_extended_id", "is_remote_frame", "is_error_frame",
+                 "is_fd", "data", "timestamp")
+
+    def __init__(self, arbitration_id: int, is_extended_id: bool, is_remote_frame: bool,
+                 is_error_frame: bool, is_fd: bool, data: bytes, timestamp: float):
+        self.arbitration_id = arbitration_id
+        self.is_extended_id = is_extended_id
+        self.is_remote_frame = is_remote_frame
+        self.is_error_frame = is_error_frame
+        self.is_fd = is_fd
+        self.data = data
+        self.timestamp = timestamp
+
+
+@functools.lru_cache(maxsize=None)
+def frame_dtype(mtu: int = CAN_MTU):
+    """
+    NumPy structured dtype matching struct can_frame (mtu=CAN_MTU) or struct canfd_frame (mtu=CANFD_MTU).
+    The id field holds the raw can_id including the EFF/RTR/ERR flag bits. Built once per mtu.
+    """
+    return np.dtype([("id", "<u4"), ("dlc", "u1"), ("flags", "u1"), ("pad", "u1", (2,)),
+                     ("data", "u1", (mtu - 8,))])
+
+
+def _pack_frame(buf: bytearray, can_id: int, data: CanPayload, is_fd: bool) -> memoryview:
+    """Fill buf with the can_frame/canfd_frame for data, returns the part to write to the socket"""
+    n = len(data)
+    if n > (CANFD_MTU if is_fd else CAN_MTU) - 8:
+        raise ValueError(f"CAN{' FD' if is_fd else ''} payload of {n} bytes is too long")
+    if is_fd:
+        length = next(i for i in _CANFD_LENGTHS if i >= n)
+        _CAN_FRAME_HEADER.pack_into(buf, 0, can_id, length, CANFD_FDF)
+        mtu = CANFD_MTU
+    else:
+        _CAN_FRAME_HEADER.pack_into(buf, 0, can_id, n, 0)
+        mtu = CAN_MTU
+    buf[8:8 + n] = data
+    buf[8 + n:mtu] = _ZERO_PAYLOAD[:mtu - 8 - n]
+    return memoryview(buf)[:mtu]
+
+
+def _unpack_frame(buf, off: int, frame_len: int, timestamp: float) -> _RawFrame:
+    """Decode the can_frame/canfd_frame of frame_len bytes starting at off"""
+    can_id, length, _flags = _CAN_FRAME_HEADER.unpack_from(buf, off)
+    return _RawFrame(can_id & CAN_EFF_MASK, bool(can_id & CAN_EFF_FLAG), bool(can_id & CAN_RTR_FLAG),
+                     bool(can_id & CAN_ERR_FLAG), frame_len == CANFD_MTU,
+                     bytes(buf[off + 8:off + 8 + length]), timestamp)
+
+
+class _IOVec(ctypes.Structure):
+    _fields_ = [("iov_base", ctypes.c_void_p),
+                ("iov_len", ctypes.c_size_t)]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [("msg_name", ctypes.c_void_p),
+                ("msg_namelen", ctypes.c_uint32),
+                ("msg_iov", ctypes.POINTER(_IOVec)),
+                ("msg_iovlen", ctypes.c_size_t),
+                ("msg_control", ctypes.c_void_p),
+                ("msg_controllen", ctypes.c_size_t),
+                ("msg_flags", ctypes.c_int)]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [("msg_hdr", _MsgHdr),
+                ("msg_len", ctypes.c_uint)]
+
+
+def _load_recvmmsg():
+    """Look up recvmmsg() in libc, None if the platform does not provide it"""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        func = ctypes.CDLL(None, use_errno=True).recvmmsg
+    except (OSError, AttributeError):
+        return None
+    func.argtypes = (ctypes.c_int, ctypes.POINTER(_MMsgHdr), ctypes.c_uint, ctypes.c_int, ctypes.c_void_p)
+    func.restype = ctypes.c_int
+    return func
+
+
+_recvmmsg = _load_recvmmsg()
+
+
+class _RecvBatch:
+    """Preallocated frame buffer and mmsghdr vector for one recvmmsg() call"""
+
+    def __init__(self, size: int, mtu: int):
+        self.size = size
+        self.mtu = mtu
+        self.buf = ctypes.create_string_buffer(size * mtu)
+        self.iovecs = (_IOVec * size)()
+        self.hdrs = (_MMsgHdr * size)()
+        base = ctypes.addressof(self.buf)
+        for i in range(size):
+            self.iovecs[i].iov_base = base + i * mtu
+            self.iovecs[i].iov_len = mtu
+            self.hdrs[i].msg_hdr.msg_iov = ctypes.pointer(self.iovecs[i])
+            self.hdrs[i].msg_hdr.msg_iovlen = 1
+
+    def recv(self, fd: int, max_n: int) -> int:
+        """Read up to max_n frames without blocking, returns the number of frames read"""
+        n = _recvmmsg(fd, self.hdrs, min(max_n, self.size), MSG_DONTWAIT, None)
+        if n < 0:
+            err = ctypes.get_errno()
+            if err in (errno.EAGAIN, errno.EWOULDBLOCK):
+                return 0
+            raise OSError(err, "recvmmsg failed")
+        return n
+
+    def parse(self, n: int) -> List[_RawFrame]:
+        """Decode the first n frames of the buffer"""
+        view = memoryview(self.buf)
+        mtu = self.mtu
+        hdrs = self.hdrs
+        timestamp = time.time()
+        return [_unpack_frame(view, i * mtu, hdrs[i].msg_len, timestamp) for i in range(n)]
+
+    def as_array(self, n: int):
+        """Zero-copy NumPy view of the first n frames, valid until the next recv()"""
+        return np.frombuffer(self.buf, dtype=frame_dtype(self.mtu), count=n)
+
+
+def _set_rcvbuf(sock: socket.socket, size: int):
+    """
+    Enlarge the kernel receive queue of a socket. SO_RCVBUFFORCE ignores net.core.rmem_max
+    but needs CAP_NET_ADMIN, without it SO_RCVBUF is used which is capped by rmem_max.
+    """
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, SO_RCVBUFFORCE, size)
+    except OSError:
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, size)
+        except OSError as e:
+            log.warning("Could not set socket receive buffer: %s", e)
+            return
+    log.info("Socket receive buffer: %d bytes", sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF))
+
+
+def _steer_irq(channel: str, cpu: int):
+    """Route the interrupts of the CAN device to the given CPU, needs root"""
+    try:
+        with open("/proc/interrupts", encoding="utf-8") as f:
+            lines = [line.split() for line in f]
+        irqs = [fields[0].rstrip(":") for fields in lines
+                if len(fields) > 1 and fields[-1] == channel and fields[0].rstrip(":").isdigit()]
+    except OSError:
+        return
+    for irq in irqs:
+        try:
+            # the list form also works for CPUs beyond the first 32 bit mask group
+            with open(f"/proc/irq/{irq}/smp_affinity_list", "w", encoding="utf-8") as f:
+                f.write(str(cpu))
+            log.info("Steered IRQ %s of %s to CPU %d", irq, channel, cpu)
+        except OSError as e:
+            log.warning("Could not steer IRQ %s of %s: %s", irq, channel, e)
+
+
+def _pin_thread(cpu: int):
+    """Pin the calling thread to the given CPU"""
+    if not hasattr(os, "sched_setaffinity"):
+        log.warning("CPU affinity not supported on this platform")
+        return
+    try:
+        os.sched_setaffinity(0, {cpu})
+        log.info("Pinned CAN receive thread %s to CPU %d", threading.current_thread().name, cpu)
+    except OSError as e:
+        log.warning("Could not pin CAN receive thread to CPU %d: %s", cpu, e)
+
 
-    def get_arbitration_id(self) -> int:
-        return self.msg.arbitration_id
+@functools.lru_cache(maxsize=None)
+def _rx_reader_class():
+    """The notifier listener class, defined on first use as python-can is imported lazily"""
+    import can  # pylint: disable=import-outside-toplevel
 
-    def get_data(self):
-        return self.msg.data
+    class _RxReader(can.BufferedReader):
+        """
+        BufferedReader handling errors in on_error, which keeps the notifier thread receiving
+        after transient bus errors instead of letting it die. If a CPU is given the notifier
+        thread pins itself to it on the first frame.
+        """
 
-    def is_extended_id(self) -> bool:
-        return self.msg.is_extended_id
+        def __init__(self, cpu: Optional[int] = None):
+            super().__init__()
+            if cpu is not None:
+                self._cpu = cpu
+                # shadows the class method until the first frame, later frames take the plain path
+                self.on_message_received = self._pin_and_receive
 
-    def get_timestamp(self):
-        return self.msg.timestamp
+        def _pin_and_receive(self, msg: "can.Message"):
+            _pin_thread(self._cpu)
+            del self.on_message_received
+            self.on_message_received(msg)
+
+        def on_error(self, exc: Exception):
+            log.error("Error while waiting for recv from CAN: %s", exc)
+
+    return _RxReader
 
 
 class CANClient:
     def __init__(self, interface: str = "socketcan", channel: str = "vcan0", 
-                 bitrate: int = 500000, port: int = None, fd: bool = False, **kwargs):
-        self.interface = interface
-        self.channel = channel
-        self.bitrate = bitrate
-        self.fd = fd
-        
-        log.info(f"Initializing CAN client: interface={interface}, channel={channel}, bitrate={bitrate}, fd={fd}")
+                 bitrate: int = 500000, port: int = None, fd: bool = False,
+                 notifier: bool = True, rcvbuf: Optional[int] = RCVBUF_SIZE,
+                 cpu_affinity: Optional[int] = None, **kwargs):
+        import can  # pylint: disable=import-outside-toplevel
+        self._init_state(interface, channel, bitrate, fd, cpu_affinity)
+
+        log.info("Initializing CAN client: interface=%s, channel=%s, bitrate=%s, fd=%s",
+                 interface, channel, bitrate, fd)
         
         if interface == "kuksa":
             # KUKSA CAN provider configuration
@@ -43,12 +288,14 @@ class CANClient:
                     can_fd=fd
                 )
                 self._bus = self._kuksa_client.bus
-                log.info(f"KUKSA CAN bus initialized: {channel} with bitrate {bitrate}, FD={fd}")
+                # the bridge does not take python-can arguments, install the filters on its bus
+                if kwargs.get("can_filters") is not None:
+                    self.set_filters(kwargs["can_filters"])
+                log.info("KUKSA CAN bus initialized: %s with bitrate %s, FD=%s", channel, bitrate, fd)
             except ImportError:
                 log.warning("KUKSA CAN bridge not available, falling back to python-can")
                 # Fallback to standard python-can with appropriate interface
-                system = platform.system().lower()
-                if system == "windows":
+                if _IS_WINDOWS:
                     # On Windows, try PCAN or fallback to virtual
                     if "PCAN" in channel.upper():
                         self._bus = can.interface.Bus(interface="pcan", channel=channel, bitrate=bitrate, fd=fd, **kwargs)
@@ -59,10 +306,10 @@ class CANClient:
                     try:
                         self._bus = can.interface.Bus(interface="socketcan", channel=channel, bitrate=bitrate, fd=fd, **kwargs)
                     except Exception as e:
-                        log.warning(f"SocketCAN failed: {e}, using virtual")
+                        log.warning("SocketCAN failed: %s, using virtual", e)
                         self._bus = can.interface.Bus(interface="virtual", channel=channel, bitrate=bitrate, **kwargs)
             except Exception as e:
-                log.error(f"Failed to initialize KUKSA CAN: {e}, using virtual fallback")
+                log.error("Failed to initialize KUKSA CAN: %s, using virtual fallback", e)
                 self._bus = can.interface.Bus(interface="virtual", channel=channel, bitrate=bitrate, **kwargs)
                 
         elif interface == "udp_multicast":
@@ -79,57 +326,353 @@ class CANClient:
             # Direct python-can interface
             self._bus = can.interface.Bus(interface=interface, channel=channel, bitrate=bitrate, fd=fd, **kwargs)
         
-        log.info(f"CAN bus initialized: {self._bus.channel_info}")
+        log.info("CAN bus initialized: %s", self._bus.channel_info)
+        # bound once to spare the attribute lookups per frame
+        self._recv = self._bus.recv
+        self._send = self._bus.send
+        self._msg_cls = can.Message
+        # bus errors are reported, anything else is a bug and propagates
+        self._can_errors = (can.CanError, OSError)
+        # send() fills in this message instead of constructing a new one per frame,
+        # the interfaces serialize (or copy) the message before send() returns
+        self._tx_template = self._msg_cls(is_extended_id=False, is_fd=fd, data=bytearray(64 if fd else 8))
+
+        raw_socket = getattr(self._bus, "socket", None) if interface == "socketcan" else None
+        if not isinstance(raw_socket, socket.socket):
+            raw_socket = None
+        if raw_socket is not None and rcvbuf:
+            _set_rcvbuf(raw_socket, rcvbuf)
+
+        # a python-can Notifier thread reads the bus and buffers the messages,
+        # so recv() only has to take them from the reader's queue. The queue is
+        # unbounded: a consumer slower than the bus grows memory instead of the
+        # kernel dropping frames.
+        if notifier:
+            self._reader = _rx_reader_class()(cpu_affinity)
+            self._notifier = can.Notifier(self._bus, [self._reader])
+            self._recv = self._reader.get_message
+
+        if cpu_affinity is not None:
+            _steer_irq(channel, cpu_affinity)
+
+        # raw socket batch receive, only available for SocketCAN on Linux
+        # and only if no notifier thread is consuming the socket
+        if raw_socket is not None and _recvmmsg is not None and self._notifier is None:
+            self._raw_fd = raw_socket.fileno()
+
+    def _init_state(self, interface: str, channel: str, bitrate: Optional[int], fd: bool,
+                    cpu_affinity: Optional[int]):
+        """Set up the state shared by all clients, before the bus or socket is opened"""
+        self._kuksa_client = None
+        self.interface = interface
+        self.channel = channel
+        self.bitrate = bitrate
+        self.fd = fd
+        self.cpu_affinity = cpu_affinity
+        # wrappers handed out by recv() are rebound instead of allocated,
+        # callers give them back with CANMessage.release()
+        self._free: Deque[CANMessage] = collections.deque()
+        self._free.extend(CANMessage(None, self._free) for _ in range(MSG_POOL_SIZE))
+        self._reader: Optional["can.BufferedReader"] = None
+        self._notifier: Optional["can.Notifier"] = None
+        # set to the socket descriptor if recv_many()/recv_array() can use recvmmsg()
+        self._batch: Optional[_RecvBatch] = None
+        self._raw_fd = -1
+
+    def pin_rx_thread(self):
+        """
+        Pin the calling thread to the configured CPU, call it from the thread calling recv().
+        With a notifier the notifier thread pins itself when it receives its first frame and
+        this does nothing, so the consumer does not compete with it for the same CPU.
+        """
+        if self.cpu_affinity is not None and self._notifier is None:
+            _pin_thread(self.cpu_affinity)
 
     def stop(self):
         try:
-            if hasattr(self, '_kuksa_client') and self._kuksa_client:
+            if self._notifier is not None:
+                # also stops the reader
+                self._notifier.stop()
+            if self._kuksa_client is not None:
                 self._kuksa_client.stop()
             else:
                 self._bus.shutdown()
             log.info("CAN client stopped successfully")
         except Exception as e:
-            log.warning(f"Error shutting down CAN bus: {e}")
+            log.warning("Error shutting down CAN bus: %s", e)
+
+    def set_filters(self, filters: Optional["CanFilters"]):
+        """
+        Install acceptance filters, on SocketCAN they are applied by the kernel so
+        frames with other ids never reach userspace. None receives all frames.
+        """
+        self._bus.set_filters(filters)
 
     def recv(self, timeout: Optional[float] = 1) -> Optional[CANMessage]:
         try:
-            msg = self._bus.recv(timeout)
-        except can.CanError as e:
-            log.error(f"Error while waiting for recv from CAN: {e}")
-            msg = None
-        except Exception as e:
-            log.error(f"Unexpected error receiving CAN message: {e}")
+            msg = self._recv(timeout)
+        except self._can_errors as e:
+            log.error("Error while waiting for recv from CAN: %s", e)
             msg = None
             
         if msg:
-            return CANMessage(msg)
+            return self._wrap(msg)
         return None
 
-    def send(self, arbitration_id: int, data: bytes, is_extended_id: bool = False, is_fd: bool = None):
+    def recv_many(self, max_n: int = RECV_BATCH_SIZE, timeout: Optional[float] = 1) -> List[CANMessage]:
+        """
+        Receive up to max_n messages, waiting at most timeout seconds for the first one.
+        Without notifier on SocketCAN all frames already queued on the socket are fetched
+        with a single recvmmsg() call.
+        """
+        if self._raw_fd < 0:
+            msgs = []
+            msg = self.recv(timeout)
+            while msg is not None:
+                msgs.append(msg)
+                if len(msgs) >= max_n:
+                    break
+                msg = self.recv(0)
+            return msgs
+
+        n = self._recv_batch(max_n, timeout)
+        return [self._wrap(msg) for msg in self._parse_batch(n)]
+
+    def recv_array(self, max_n: int = RECV_BATCH_SIZE, timeout: Optional[float] = 1):
+        """
+        Receive up to max_n frames as a NumPy structured array of frame_dtype(), so decoders
+        can process ids and payloads in bulk. With the recvmmsg batch path the array is a
+        view of the receive buffer and only valid until the next call, this path needs
+        notifier=False. Otherwise the array is filled from recv_many(). Requires numpy.
+        """
+        if np is None:
+            raise RuntimeError("recv_array requires numpy")
+        mtu = CANFD_MTU if self.fd else CAN_MTU
+        if self._raw_fd < 0:
+            msgs = self.recv_many(max_n, timeout)
+            # collect the columns and assign each once instead of filling the array per row
+            width = mtu - 8
+            ids = []
+            lengths = []
+            flags = []
+            payload = bytearray()
+            for msg in msgs:
+                frame = msg.msg
+                data = frame.data
+                can_id = frame.arbitration_id
+                if frame.is_extended_id:
+                    can_id |= CAN_EFF_FLAG
+                if frame.is_remote_frame:
+                    can_id |= CAN_RTR_FLAG
+                if frame.is_error_frame:
+                    can_id |= CAN_ERR_FLAG
+                ids.append(can_id)
+                lengths.append(len(data))
+                flags.append(CANFD_FDF if frame.is_fd else 0)
+                payload += data
+                payload += _ZERO_PAYLOAD[:width - len(data)]
+                msg.release()
+            arr = np.zeros(len(msgs), dtype=frame_dtype(mtu))
+            arr["id"] = ids
+            arr["dlc"] = lengths
+            arr["flags"] = flags
+            arr["data"] = np.frombuffer(payload, dtype=np.uint8).reshape(-1, width)
+            return arr
+
+        n = self._recv_batch(max_n, timeout)
+        return self._batch.as_array(n)
+
+    def _recv_batch(self, max_n: int, timeout: Optional[float]) -> int:
+        """Wait for the raw socket and read up to max_n frames into the batch buffer"""
+        if self._batch is None or self._batch.size < max_n:
+            self._batch = _RecvBatch(max_n, CANFD_MTU if self.fd else CAN_MTU)
+        try:
+            ready, _, _ = select.select([self._raw_fd], [], [], timeout)
+            if not ready:
+                return 0
+            return self._batch.recv(self._raw_fd, max_n)
+        except OSError as e:
+            log.error("Error while waiting for recv from CAN: %s", e)
+            return 0
+
+    def _parse_batch(self, n: int) -> List["can.Message"]:
+        """Convert the first n frames of the batch buffer into can.Message objects, as recv() returns"""
+        msg_cls = self._msg_cls
+        channel = self.channel
+        return [msg_cls(timestamp=frame.timestamp, arbitration_id=frame.arbitration_id,
+                        is_extended_id=frame.is_extended_id, is_remote_frame=frame.is_remote_frame,
+                        is_error_frame=frame.is_error_frame, is_fd=frame.is_fd, dlc=len(frame.data),
+                        data=frame.data, channel=channel)
+                for frame in self._batch.parse(n)]
+
+    def _wrap(self, msg: "can.Message") -> CANMessage:
+        try:
+            canmsg = self._free.popleft()
+        except IndexError:
+            # pool exhausted, wrapper joins the pool once released
+            canmsg = CANMessage(None, self._free)
+        canmsg.msg = msg
+        return canmsg
+
+    def send(self, arbitration_id: int, data: CanPayload, is_extended_id: bool = False, is_fd: bool = None):
+        """
+        Write a frame to the CAN bus. The frame is built in a message shared by all calls,
+        so send() must not be called from several threads at once.
+        """
         if is_fd is None:
             is_fd = self.fd
-            
-        msg = can.Message(
-            arbitration_id=arbitration_id, 
-            data=data, 
-            is_extended_id=is_extended_id,
-            is_fd=is_fd
-        )
+
+        msg = self._tx_template
+        msg.arbitration_id = arbitration_id
+        msg.is_extended_id = is_extended_id
+        msg.is_fd = is_fd
+        msg.data[:] = data
+        msg.dlc = len(data)
         try:
-            self._bus.send(msg)
-            log.debug(f"CAN message sent: ID={arbitration_id:X}, Data={data.hex()}, FD={is_fd}")
-        except can.CanError as e:
-            log.error(f"Failed to send message via CAN bus: {e}")
-        except Exception as e:
-            log.error(f"Unexpected error sending CAN message: {e}")
+            self._send(msg)
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("CAN message sent: ID=%X, len=%d, FD=%s", arbitration_id, len(data), is_fd)
+        except self._can_errors as e:
+            log.error("Failed to send message via CAN bus: %s", e)
+
+    def make_sender(self, arbitration_id: int, is_extended_id: bool = False,
+                    is_fd: bool = None) -> Callable[[CanPayload], None]:
+        """
+        Return a function sending its data argument with the given id and flags.
+        Id and flags are bound once, so periodic senders of a fixed set of ids skip
+        the per call argument handling of send(). Each returned function reuses its own
+        message, so it must not be called from several threads at once.
+        """
+        if is_fd is None:
+            is_fd = self.fd
+        msg = self._msg_cls(arbitration_id=arbitration_id, is_extended_id=is_extended_id, is_fd=is_fd,
+                            data=bytearray(64 if is_fd else 8))
+        bus_send = self._send
+        can_errors = self._can_errors
+
+        def _send(data: CanPayload):
+            msg.data[:] = data
+            msg.dlc = len(data)
+            try:
+                bus_send(msg)
+            except can_errors as e:
+                log.error("Failed to send message via CAN bus: %s", e)
+        return _send
 
     def send_message(self, message: CANMessage):
         """Send a CANMessage object"""
         try:
-            self._bus.send(message.msg)
-            log.debug(f"CAN message sent: ID={message.get_arbitration_id():X}")
-        except can.CanError as e:
-            log.error(f"Failed to send CANMessage via CAN bus: {e}")
+            self._send(message.msg)
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("CAN message sent: ID=%X", message.get_arbitration_id())
+        except self._can_errors as e:
+            log.error("Failed to send CANMessage via CAN bus: %s", e)
+
+
+class SocketCanRawClient(CANClient):
+    """
+    CANClient reading and writing a raw SocketCAN socket directly, keeping python-can
+    out of the per frame path. Linux only.
+    """
+
+    def __init__(self, channel: str = "vcan0", fd: bool = False, rcvbuf: Optional[int] = RCVBUF_SIZE,
+                 cpu_affinity: Optional[int] = None, can_filters: Optional["CanFilters"] = None):
+        # CANClient.__init__ would open a python-can bus, only the shared state is wanted
+        # pylint: disable=super-init-not-called
+        self._init_state("socketcan", channel, None, fd, cpu_affinity)
+
+        log.info("Initializing raw SocketCAN client: channel=%s, fd=%s", channel, fd)
+        self._sock = socket.socket(socket.AF_CAN, socket.SOCK_RAW, socket.CAN_RAW)
+        if fd:
+            self._sock.setsockopt(socket.SOL_CAN_RAW, socket.CAN_RAW_FD_FRAMES, 1)
+        self.set_filters(can_filters)
+        self._sock.bind((channel,))
+        if rcvbuf:
+            _set_rcvbuf(self._sock, rcvbuf)
+
+        self._mtu = CANFD_MTU if fd else CAN_MTU
+        self._rx_buf = bytearray(self._mtu)
+        self._tx_buf = bytearray(CANFD_MTU)
+        self._recv = self._sock.recv_into
+        # settimeout() costs a syscall, recv() only calls it when the timeout changes
+        self._timeout = self._sock.gettimeout()
+        self._send = self._sock.send
+        self._can_errors = (OSError,)
+        if _recvmmsg is not None:
+            self._raw_fd = self._sock.fileno()
+
+        if cpu_affinity is not None:
+            _steer_irq(channel, cpu_affinity)
+
+    def set_filters(self, filters: Optional["CanFilters"]):
+        if not filters:
+            filters = [{"can_id": 0, "can_mask": 0}]
+        filter_data = []
+        for can_filter in filters:
+            can_id = can_filter["can_id"]
+            can_mask = can_filter["can_mask"]
+            if "extended" in can_filter:
+                # match either standard or extended ids only
+                can_mask |= CAN_EFF_FLAG
+                if can_filter["extended"]:
+                    can_id |= CAN_EFF_FLAG
+            filter_data += [can_id, can_mask]
+        self._sock.setsockopt(socket.SOL_CAN_RAW, socket.CAN_RAW_FILTER,
+                              struct.pack(f"={len(filter_data)}I", *filter_data))
+
+    def _parse_batch(self, n: int) -> List[_RawFrame]:
+        return self._batch.parse(n)
+
+    def stop(self):
+        self._sock.close()
+        log.info("CAN client stopped successfully")
+
+    def recv(self, timeout: Optional[float] = 1) -> Optional[CANMessage]:
+        if timeout != self._timeout:
+            self._sock.settimeout(timeout)
+            self._timeout = timeout
+        try:
+            n = self._recv(self._rx_buf)
+        except (socket.timeout, BlockingIOError):
+            # timeout 0 makes the socket non-blocking, an empty queue raises EAGAIN
+            return None
+        except self._can_errors as e:
+            log.error("Error while waiting for recv from CAN: %s", e)
+            return None
+        return self._wrap(_unpack_frame(self._rx_buf, 0, n, time.time()))
+
+    def send(self, arbitration_id: int, data: CanPayload, is_extended_id: bool = False, is_fd: bool = None):
+        """Write a frame to the socket, the frame buffer is shared so use a single sending thread"""
+        if is_fd is None:
+            is_fd = self.fd
+
+        can_id = arbitration_id | CAN_EFF_FLAG if is_extended_id else arbitration_id
+        try:
+            self._send(_pack_frame(self._tx_buf, can_id, data, is_fd))
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("CAN message sent: ID=%X, len=%d, FD=%s", arbitration_id, len(data), is_fd)
+        except self._can_errors as e:
+            log.error("Failed to send message via CAN bus: %s", e)
+
+    def make_sender(self, arbitration_id: int, is_extended_id: bool = False,
+                    is_fd: bool = None) -> Callable[[CanPayload], None]:
+        if is_fd is None:
+            is_fd = self.fd
+        can_id = arbitration_id | CAN_EFF_FLAG if is_extended_id else arbitration_id
+        sock_send = self._send
+        can_errors = self._can_errors
+        buf = bytearray(CANFD_MTU)
+
+        def _send(data: CanPayload):
+            try:
+                sock_send(_pack_frame(buf, can_id, data, is_fd))
+            except can_errors as e:
+                log.error("Failed to send message via CAN bus: %s", e)
+        return _send
+
+    def send_message(self, message: CANMessage):
+        """Send a CANMessage object"""
+        self.send(message.get_arbitration_id(), message.get_data(), message.is_extended_id(), message.msg.is_fd)
 
 
 def create_kuksa_client(channel: str = "PCAN_USBBUS1", bitrate: int = 500000, can_fd: bool = False, **kwargs) -> CANClient:
@@ -139,39 +682,41 @@ def create_kuksa_client(channel: str = "PCAN_USBBUS1", bitrate: int = 500000, ca
     return CANClient(interface="kuksa", channel=channel, bitrate=bitrate, fd=can_fd, **kwargs)
 
 
-def create_default_client(channel: str = None, bitrate: int = 500000, can_fd: bool = False) -> CANClient:
+def create_default_client(channel: str = None, bitrate: int = 500000, can_fd: bool = False,
+                          can_filters: Optional["CanFilters"] = None) -> CANClient:
     """
-    Create appropriate CAN client based on platform
+    Create appropriate CAN client based on platform, installing can_filters on the bus
     """
-    system = platform.system().lower()
-    
     if channel is None:
-        channel = "vcan0" if system != "windows" else "PCAN_USBBUS1"
+        channel = "PCAN_USBBUS1" if _IS_WINDOWS else "vcan0"
     
-    log.info(f"Creating default CAN client for system={system}, channel={channel}")
+    log.info("Creating default CAN client for system=%s, channel=%s", _SYSTEM, channel)
     
     try:
-        if system == "windows":
+        if _IS_WINDOWS:
             # On Windows, prefer KUKSA CAN provider with PCAN
             try:
-                return create_kuksa_client(channel=channel, bitrate=bitrate, can_fd=can_fd)
+                return create_kuksa_client(channel=channel, bitrate=bitrate, can_fd=can_fd, can_filters=can_filters)
             except Exception as e:
-                log.warning(f"KUKSA CAN initialization failed: {e}")
+                log.warning("KUKSA CAN initialization failed: %s", e)
                 # Fallback to virtual interface
-                return CANClient(interface="virtual", channel=channel, bitrate=bitrate, fd=can_fd)
+                return CANClient(interface="virtual", channel=channel, bitrate=bitrate, fd=can_fd,
+                                 can_filters=can_filters)
         else:
             # On Linux, try socketcan first
             try:
-                return CANClient(interface="socketcan", channel=channel, bitrate=bitrate, fd=can_fd)
+                return CANClient(interface="socketcan", channel=channel, bitrate=bitrate, fd=can_fd,
+                                 can_filters=can_filters)
             except Exception as e:
-                log.warning(f"SocketCAN initialization failed: {e}")
+                log.warning("SocketCAN initialization failed: %s", e)
                 # Fallback to KUKSA or virtual
                 try:
-                    return create_kuksa_client(channel=channel, bitrate=bitrate, can_fd=can_fd)
+                    return create_kuksa_client(channel=channel, bitrate=bitrate, can_fd=can_fd, can_filters=can_filters)
                 except Exception:
                     log.info("Using virtual CAN as fallback")
-                    return CANClient(interface="virtual", channel=channel, bitrate=bitrate, fd=can_fd)
+                    return CANClient(interface="virtual", channel=channel, bitrate=bitrate, fd=can_fd,
+                                     can_filters=can_filters)
     except Exception as e:
-        log.error(f"Failed to initialize CAN bus: {e}")
+        log.error("Failed to initialize CAN bus: %s", e)
         log.info("Using virtual CAN as final fallback")
-        return CANClient(interface="virtual", channel=channel, bitrate=bitrate, fd=can_fd)
\ No newline at end of file
+        return CANClient(interface="virtual", channel=channel, bitrate=bitrate, fd=can_fd, can_filters=can_filters)
\ No newline at end of file
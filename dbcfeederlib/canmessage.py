@@ -12,7 +12,10 @@
 ########################################################################
 
 import logging
-import can  # type: ignore
+from typing import TYPE_CHECKING, Deque, Optional
+
+if TYPE_CHECKING:
+    import can  # type: ignore
 
 log = logging.getLogger(__name__)
 
@@ -23,10 +26,15 @@ class CANMessage:
     Reason is to make it simple to replace the CAN package dependency with something else if your KUKSA.val
     integration cannot interact directly with CAN, but rather interacts with some custom CAN solution/middleware.
     This wrapper class represents a https://python-can.readthedocs.io/en/stable/message.html#can.Message
+    Clients reuse wrappers from a pool, so per frame hot loops may read the wrapped message
+    from the msg attribute directly until the wrapper is released.
     """
 
-    def __init__(self, msg: can.Message):
+    __slots__ = ("msg", "_pool")
+
+    def __init__(self, msg: "can.Message", pool: Optional[Deque["CANMessage"]] = None):
         self.msg = msg
+        self._pool = pool
 
     def get_arbitration_id(self) -> int:
         """Get arbitration/frame id of message"""
@@ -35,3 +43,20 @@ class CANMessage:
     def get_data(self):
         """Get message data"""
         return self.msg.data
+
+    def is_extended_id(self) -> bool:
+        """Check whether the message uses a 29 bit identifier"""
+        return self.msg.is_extended_id
+
+    def get_timestamp(self):
+        """Get receive timestamp of message"""
+        return self.msg.timestamp
+
+    def release(self):
+        """Return the wrapper to the pool of the client that received it"""
+        if self.msg is None:
+            # already released, pooling it twice would hand it out twice
+            return
+        self.msg = None
+        if self._pool is not None:
+            self._pool.append(self)
@@ -25,7 +25,7 @@ import platform  # THÊM IMPORT NÀY
 from queue import Queue
 from typing import Optional
 
-from dbcfeederlib.canclient import CANClient, create_default_client
+from dbcfeederlib.canclient_window_interface import CANClient, create_default_client
 from dbcfeederlib import canreader
 from dbcfeederlib import dbc2vssmapper
 
@@ -40,12 +40,19 @@ class DBCReader(canreader.CanReader):
     def _rx_worker(self):
 
         log.info("Starting to receive CAN messages fom bus")
+        self._canclient.pin_rx_thread()
         while self.is_running():
             msg = self._canclient.recv(timeout=1)
             if msg is not None:
-                log.debug("Processing CAN message with frame ID %#x", msg.get_arbitration_id())
-                log.debug("Type of ID: %s - data:%s", type(msg.get_arbitration_id()), type(msg.get_data()))
-                self._process_can_message(msg.get_arbitration_id(), msg.get_data())
+                try:
+                    # read the wrapped frame once instead of going through the accessors
+                    frame = msg.msg
+                    if log.isEnabledFor(logging.DEBUG):
+                        log.debug("Processing CAN message with frame ID %#x", frame.arbitration_id)
+                        log.debug("Type of ID: %s - data:%s", type(frame.arbitration_id), type(frame.data))
+                    self._process_can_message(frame.arbitration_id, frame.data)
+                finally:
+                    msg.release()
         log.info("Stopped receiving CAN messages from bus")
 
     def _start_can_bus_listener(self):
@@ -58,11 +65,12 @@ class DBCReader(canreader.CanReader):
                     self._canclient = create_default_client(
                         channel=self._can_kwargs["channel"],
                         bitrate=500000,
-                        can_fd=self._can_kwargs.get("fd", False)
+                        can_fd=self._can_kwargs.get("fd", False),
+                        can_filters=self._can_kwargs.get("can_filters")
                     )
                     log.info("✓ Using default CAN client for Windows")
                 except Exception as e:
-                    log.error(f"Failed to create default CAN client: {e}")
+                    log.error("Failed to create default CAN client: %s", e)
                     # Fallback cuối cùng
                     self._canclient = CANClient(interface="virtual", channel="virtual_channel", bitrate=500000)
                     log.info("✓ Using virtual CAN client as fallback")
@@ -71,7 +79,7 @@ class DBCReader(canreader.CanReader):
                 self._canclient = CANClient(**self._can_kwargs)
                 
         except Exception as e:
-            log.error(f"Failed to initialize CAN client: {e}")
+            log.error("Failed to initialize CAN client: %s", e)
             # Fallback cuối cùng
             self._canclient = CANClient(interface="virtual", channel="virtual_channel", bitrate=500000)
             log.info("✓ Using virtual CAN client as final fallback")